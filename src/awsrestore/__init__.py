@@ -1,12 +1,15 @@
-from .vault import Vault
-import boto3
+from .vault import RecoveryPoint, Vault, _client
+from botocore.exceptions import ClientError, NoCredentialsError
 
-def check_aws_credentials():
+def verify_credentials():
+    """
+    Checks that valid AWS credentials are available
+    
+    Returns True if STS accepts the current credentials, otherwise False
+    """
     try:
-        client = boto3.client('sts')
-        response = client.get_caller_identity()
-    except Exception as error:
-        print("No valid credentials found")
-        
-
-check_aws_credentials()
\ No newline at end of file
+        _client('sts').get_caller_identity()
+    except (ClientError, NoCredentialsError):
+        return False
+    
+    return True
@@ -0,0 +1,342 @@
+import asyncio
+from collections import OrderedDict
+
+try:
+    from aiobotocore.config import AioConfig
+    from aiobotocore.session import get_session
+except ImportError:
+    AioConfig = None
+    get_session = None
+
+from .vault import (
+    _CFG_SETTINGS,
+    _DEST_VAULT_ARN,
+    _RESTORE_TERMINAL_STATUSES,
+    _RESTORE_WAIT_MAX_ATTEMPTS,
+    _ROLE_ARN,
+    _RP_CACHE_SIZE,
+    RecoveryPoint,
+    _ebs_restore_metadata,
+    _list_backups_kwargs,
+    _rp_description
+)
+
+_SESSION = get_session() if get_session is not None else None
+
+_account = None
+
+
+async def _cached_account(region):
+    """
+    Returns the AWS account ID of the current credentials, calling STS only once per process
+    """
+    global _account
+    if _account is None:
+        async with _SESSION.create_client('sts', region_name=region, 
+                                          config=AioConfig(**_CFG_SETTINGS)) as client:
+            _account = (await client.get_caller_identity())['Account']
+    return _account
+
+
+class AsyncVault():
+    """
+    An asyncio version of Vault backed by aiobotocore
+    
+    The client is opened and closed with the Vault, so use it as an async context manager:
+        
+        async with AsyncVault('vault-1') as vault:
+            await vault.restore_ebs_bulk(arns)
+    """
+    
+    def __init__(self,
+                 vault_name,
+                 account=None,
+                 region='us-east-1',
+                 partition='aws',
+                 role_name='AWSBackupDefaultServiceRole',
+                 concurrency=50):
+        """
+        Parameters
+        ---------
+        vault_name : str
+            the name of the AWS Backup vault
+        account : str
+            the name of the AWS account the Backup Vault is located
+            Defaults to the account of the current credentials, looked up on entering the Vault
+        region : str
+            the name of the AWS region the Backup Vault is located
+        partition : str
+            the AWS partition the account is in eg. 'aws', 'aws-cn' or 'aws-us-gov'
+        role_name : str
+            the name of the IAM service role AWS Backup uses for copy and restore jobs
+        concurrency : int
+            the maximum number of requests the bulk methods have in flight at once
+        """
+        if _SESSION is None:
+            raise ImportError("AsyncVault requires aiobotocore, install it with 'pip install aiobotocore'")
+        
+        self.vault_name = vault_name
+        self.account = account
+        self.region = region
+        self._client = None
+        self._client_context = None
+        self._concurrency = concurrency
+        self._partition = partition
+        self._role_name = role_name
+        self._role_arn = None
+        self._rp_cache = OrderedDict()
+        self._semaphore = asyncio.Semaphore(concurrency)
+    
+    async def __aenter__(self):
+        # The default account needs an STS call, which is made here so it does not block the event loop
+        if self.account is None:
+            self.account = await _cached_account(self.region)
+        self._role_arn = _ROLE_ARN.format_map({
+            'partition': self._partition,
+            'account': self.account,
+            'name': self._role_name
+        })
+        
+        # The client context wraps a coroutine that can only be awaited once, so a
+        # new one is created each time the Vault is entered
+        client_context = _SESSION.create_client(
+            'backup',
+            region_name=self.region,
+            config=AioConfig(**{**_CFG_SETTINGS, 'max_pool_connections': self._concurrency})
+        )
+        self._client = await client_context.__aenter__()
+        self._client_context = client_context
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        client_context = self._client_context
+        self._client = None
+        self._client_context = None
+        await client_context.__aexit__(exc_type, exc, tb)
+    
+    @property
+    def client(self):
+        """
+        The aiobotocore backup client, only available inside 'async with'
+        """
+        if self._client is None:
+            raise RuntimeError("AsyncVault is not open, use it as 'async with AsyncVault(...) as vault:'")
+        return self._client
+    
+    def list_backups(self,
+                     resource_type='All',
+                     created_before=None,
+                     created_after=None,
+                     max_items=None):
+        """
+        Lists the Recovery Points in the Vault as RecoveryPoint objects
+        
+        Takes the same parameters as Vault.list_backups
+        """
+        items = self.list_backups_raw(resource_type=resource_type,
+                                      created_before=created_before,
+                                      created_after=created_after,
+                                      max_items=max_items)
+        
+        return (RecoveryPoint.from_response(item) async for item in items)
+    
+    def list_backups_raw(self,
+                         resource_type='All',
+                         created_before=None,
+                         created_after=None,
+                         max_items=None):
+        """
+        Lists the Recovery Points in the Vault as the raw dicts returned by aiobotocore
+        
+        Takes the same parameters as Vault.list_backups
+        """
+        kwargs = _list_backups_kwargs(self.vault_name, resource_type, created_before,
+                                      created_after, max_items)
+        
+        return self._iter_recovery_points(kwargs)
+    
+    async def _iter_recovery_points(self, kwargs):
+        paginator = self.client.get_paginator('list_recovery_points_by_backup_vault')
+        async for page in paginator.paginate(**kwargs):
+            for item in page.get('RecoveryPoints', []):
+                yield item
+    
+    async def copy_backups(self,
+                           destination_vault,
+                           recovery_point,
+                           region='us-east-1',
+                           dest_account=None,
+                           retention_period=35):
+        """
+        Copies a Recovery Point in the Vault to a different Vault in the same or different region
+        
+        Takes the same parameters as Vault.copy_backups
+        """
+        dest_account = dest_account or await _cached_account(self.region)
+        
+        response = await self.client.start_copy_job(
+            RecoveryPointArn=recovery_point,
+            SourceBackupVaultName=self.vault_name,
+            DestinationBackupVaultArn=_DEST_VAULT_ARN.format_map({
+                'partition': self._partition,
+                'region': region,
+                'account': dest_account,
+                'name': destination_vault
+            }),
+            IamRoleArn=self._role_arn,
+            Lifecycle={
+                'DeleteAfterDays': retention_period
+            }
+        )
+        
+        return response
+    
+    async def copy_backups_bulk(self,
+                                destination_vault,
+                                recovery_points,
+                                region='us-east-1',
+                                dest_account=None,
+                                retention_period=35):
+        """
+        Copies many Recovery Points in the Vault to a different Vault concurrently
+        
+        Takes the same parameters as copy_backups, with a list of recovery_points. Returns 
+        one entry per Recovery Point, in the same order as recovery_points, holding either 
+        the copy job response or the exception raised for that Recovery Point
+        """
+        return await self._bulk(
+            lambda recovery_point: self.copy_backups(
+                destination_vault,
+                recovery_point,
+                region=region,
+                dest_account=dest_account,
+                retention_period=retention_period
+            ),
+            recovery_points
+        )
+    
+    async def restore_ebs(self,
+                          recovery_point,
+                          az='us-east-1a',
+                          iops='3000',
+                          kms_key=None,
+                          throughput='125',
+                          vol_type='gp3',
+                          wait=False):
+        """
+        Restores an EBS volume from a Recovery Point
+        
+        Takes the same parameters as Vault.restore_ebs
+        """
+        rec_point_desc = await self._describe_backup(recovery_point)
+        metadata = _ebs_restore_metadata(rec_point_desc, az, iops, kms_key, throughput, vol_type)
+        
+        response = await self.client.start_restore_job(
+            RecoveryPointArn=recovery_point,
+            Metadata=metadata,
+            IamRoleArn=self._role_arn,
+            CopySourceTagsToRestoredResource=True
+        )
+        
+        if not wait:
+            return response
+        
+        return await self._wait_for_restore(response['RestoreJobId'])
+    
+    async def restore_ec2(self,
+                          recovery_point,
+                          instance_type,
+                          key_name,
+                          vpc_id,
+                          subnet_id):
+        """
+        Restores an EC2 Instance from a Recovery Point
+        
+        Takes the same parameters as Vault.restore_ec2
+        """
+        metadata = {
+            "instancetype": instance_type,
+            "keyname": key_name,
+            "vpcid": vpc_id,
+            "subnetid": subnet_id
+        }
+        
+        response = await self.client.start_restore_job(
+            RecoveryPointArn=recovery_point,
+            Metadata=metadata,
+            IamRoleArn=self._role_arn,
+            CopySourceTagsToRestoredResource=True
+        )
+        
+        return response
+    
+    async def restore_ebs_bulk(self,
+                               recovery_points,
+                               az='us-east-1a',
+                               iops='3000',
+                               kms_key=None,
+                               throughput='125',
+                               vol_type='gp3',
+                               wait=False):
+        """
+        Restores many EBS volumes from Recovery Points concurrently
+        
+        Takes the same parameters as restore_ebs, with a list of recovery_points. Returns 
+        one entry per Recovery Point, in the same order as recovery_points, holding either 
+        the restore job response or the exception raised for that Recovery Point
+        """
+        return await self._bulk(
+            lambda recovery_point: self.restore_ebs(
+                recovery_point,
+                az=az,
+                iops=iops,
+                kms_key=kms_key,
+                throughput=throughput,
+                vol_type=vol_type,
+                wait=wait
+            ),
+            recovery_points
+        )
+    
+    async def _bulk(self, func, items):
+        async def limited(item):
+            async with self._semaphore:
+                return await func(item)
+        
+        return await asyncio.gather(*(limited(item) for item in items), return_exceptions=True)
+    
+    async def _wait_for_restore(self, restore_job_id):
+        delay = 2
+        for _ in range(_RESTORE_WAIT_MAX_ATTEMPTS):
+            restore = await self.client.describe_restore_job(
+                RestoreJobId=restore_job_id
+            )
+            if restore['Status'] in _RESTORE_TERMINAL_STATUSES:
+                return restore
+            
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 8)
+        
+        raise TimeoutError(
+            f"Restore job {restore_job_id} did not finish after {_RESTORE_WAIT_MAX_ATTEMPTS} checks, "
+            f"last status was {restore['Status']}"
+        )
+    
+    async def _describe_backup(self, recovery_point):
+        description = self._rp_cache.get(recovery_point)
+        if description is not None:
+            self._rp_cache.move_to_end(recovery_point)
+            return description
+        
+        response = await self.client.describe_recovery_point(
+            BackupVaultName=self.vault_name,
+            RecoveryPointArn=recovery_point
+        )
+        description = _rp_description(response)
+        
+        self._rp_cache[recovery_point] = description
+        self._rp_cache.move_to_end(recovery_point)
+        if len(self._rp_cache) > _RP_CACHE_SIZE:
+            self._rp_cache.popitem(last=False)
+        
+        return description
@@ -1,6 +1,188 @@
 import boto3
+import botocore.config
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
 
+_SESSION = boto3.session.Session()
+
+# Shared by the boto3 clients here and the aiobotocore clients in aio.py
+_CFG_SETTINGS = {
+    'tcp_keepalive': True,
+    'max_pool_connections': 50,
+    'retries': {'mode': 'adaptive', 'max_attempts': 10},
+    'connect_timeout': 5,
+    'read_timeout': 30
+}
+
+_CFG = botocore.config.Config(**_CFG_SETTINGS)
+
+_ROLE_ARN = 'arn:{partition}:iam::{account}:role/service-role/{name}'
+
+_DEST_VAULT_ARN = 'arn:{partition}:backup:{region}:{account}:backup-vault:{name}'
+
+_VALID_RTYPES = frozenset({
+    'All', 'Aurora', 'DocumentDB', 'CloudFormation', 'DynamoDB', 'EBS', 'EC2', 'EFS', 
+    'FSx', 'Neptune', 'RDS', 'Redshift', 'S3', 'Timestream', 'VirtualMachine'
+})
+
+_EPOCH_2015 = datetime(2015, 1, 1, tzinfo=timezone.utc)
+
+_RP_CACHE_SIZE = 512
+
+# The parts of describe_recovery_point that never change for a Recovery Point
+_RP_CACHED_FIELDS = ('BackupSizeInBytes', 'IsEncrypted', 'EncryptionKeyArn')
+
+_RESTORE_TERMINAL_STATUSES = frozenset({'COMPLETED', 'FAILED', 'ABORTED'})
+
+# Polls are 8 seconds apart once backed off, so this gives up after about an hour
+_RESTORE_WAIT_MAX_ATTEMPTS = 450
+
+_clients = {}
+_bulk_clients = {}
+_clients_lock = threading.Lock()
+
+_account = None
+_account_lock = threading.Lock()
+
+
+def _client(service, region=None):
+    """
+    Returns a client for the service and region, shared across all callers
+    """
+    key = (service, region)
+    client = _clients.get(key)
+    if client is None:
+        # boto3 Sessions are not thread-safe, so clients are only created under the lock
+        with _clients_lock:
+            client = _clients.get(key)
+            if client is None:
+                client = _clients[key] = _SESSION.client(service, region_name=region, config=_CFG)
+    return client
+
+
+def _bulk_client(region, workers):
+    """
+    Returns a backup client for the region with at least one pooled connection per worker
+    
+    One such client is kept per region and replaced by a larger one when more workers are requested
+    """
+    if workers <= _CFG.max_pool_connections:
+        return _client('backup', region)
+    
+    with _clients_lock:
+        client = _bulk_clients.get(region)
+        if client is None or client.meta.config.max_pool_connections < workers:
+            config = _CFG.merge(botocore.config.Config(max_pool_connections=workers))
+            client = _bulk_clients[region] = _SESSION.client('backup', region_name=region, config=config)
+    return client
+
+
+def _cached_account(region=None):
+    """
+    Returns the AWS account ID of the current credentials, calling STS only once per process
+    
+    STS is called in the given region so the request stays within that region's partition
+    """
+    global _account
+    if _account is None:
+        with _account_lock:
+            if _account is None:
+                _account = _client('sts', region).get_caller_identity()['Account']
+    return _account
+
+
+def _rp_description(response):
+    """
+    Keeps the fields of a describe_recovery_point response that are safe to cache
+    """
+    return {field: response[field] for field in _RP_CACHED_FIELDS if field in response}
+
+
+def _list_backups_kwargs(vault_name, resource_type, created_before, created_after, max_items):
+    """
+    Builds the paginate arguments for list_recovery_points_by_backup_vault
+    
+    Raises ValueError for an unknown resource_type before any request is made
+    """
+    if resource_type not in _VALID_RTYPES:
+        raise ValueError(
+            f"Invalid resource_type '{resource_type}', expected one of: {', '.join(sorted(_VALID_RTYPES))}"
+        )
+    
+    if created_before is None:
+        created_before = datetime.now(timezone.utc)
+    if created_after is None:
+        created_after = _EPOCH_2015
+    
+    kwargs = {
+        'BackupVaultName': vault_name,
+        'ByCreatedBefore': created_before,
+        'ByCreatedAfter': created_after
+    }
+    if resource_type != 'All':
+        kwargs['ByResourceType'] = resource_type
+    
+    pagination = {'PageSize': 1000}
+    if max_items is not None:
+        pagination['MaxItems'] = max_items
+    kwargs['PaginationConfig'] = pagination
+    
+    return kwargs
+
+
+def _ebs_restore_metadata(rec_point_desc, az, iops, kms_key, throughput, vol_type):
+    """
+    Builds the start_restore_job metadata for an EBS Recovery Point
+    """
+    encrypted = 'true' if rec_point_desc['IsEncrypted'] else 'false'
+    
+    if encrypted == 'true' and kms_key == None:
+        kms_key = rec_point_desc['EncryptionKeyArn']
+    
+    vol_size = int(rec_point_desc['BackupSizeInBytes']) >> 30
+    
+    metadata = {
+        "availabilityzone": az,
+        "encrypted": encrypted,
+        "iops": iops,
+        "throughput": throughput,
+        "volumesize": str(vol_size),
+        "volumetype": vol_type
+    }
+    if encrypted == 'true' or kms_key:
+        metadata["kmskeyid"] = kms_key
+    
+    return metadata
+
+
+@dataclass(slots=True, frozen=True)
+class RecoveryPoint():
+    """
+    A Recovery Point in an AWS Backup Vault as returned by Vault.list_backups
+    """
+    arn: str
+    resource_type: str
+    created: datetime
+    size_bytes: int
+    encrypted: bool
+    kms_key_arn: str = None
+    
+    @classmethod
+    def from_response(cls, item):
+        return cls(
+            arn=item['RecoveryPointArn'],
+            resource_type=item.get('ResourceType'),
+            created=item.get('CreationDate'),
+            size_bytes=item.get('BackupSizeInBytes'),
+            encrypted=item.get('IsEncrypted', False),
+            kms_key_arn=item.get('EncryptionKeyArn')
+        )
+
+
 class Vault():
     """
     A class to interact with an AWS Backup Vault through boto3
@@ -8,8 +190,10 @@ class Vault():
     
     def __init__(self, 
                  vault_name, 
-                 account=boto3.client('sts').get_caller_identity().get('Account'), 
-                 region='us-east-1'):
+                 account=None, 
+                 region='us-east-1',
+                 partition='aws',
+                 role_name='AWSBackupDefaultServiceRole'):
         """
         Parameters
         ---------
@@ -17,25 +201,44 @@ class Vault():
             the name of the AWS Backup vault
         account : str
             the name of the AWS account the Backup Vault is located
+            Defaults to the account of the current credentials, looked up with STS in region
         region : str
             the name of the AWS region the Backup Vault is located  
+        partition : str
+            the AWS partition the account is in eg. 'aws', 'aws-cn' or 'aws-us-gov'
+            region must be a region in this partition
+        role_name : str
+            the name of the IAM service role AWS Backup uses for copy and restore jobs
         """
         self.vault_name = vault_name
-        self.account = account
-        self.client = boto3.client('backup')
         self.region = region
+        self.account = account or _cached_account(region)
+        self.client = _client('backup', region)
+        self._partition = partition
+        self._role_arn = _ROLE_ARN.format_map({
+            'partition': partition,
+            'account': self.account,
+            'name': role_name
+        })
+        self._rp_cache = OrderedDict()
+        self._rp_cache_lock = threading.Lock()
         
     def list_backups(self, 
                      resource_type='All', 
-                     created_before=datetime.now(timezone.utc), 
-                     created_after=datetime(2015, 1, 1)):
+                     created_before=None, 
+                     created_after=None,
+                     max_items=None):
         """
         Lists the Recovery Points in the Vault based on the provided information
         
+        Recovery Points are yielded one at a time as RecoveryPoint objects, fetching 
+        further pages from AWS as needed
+        
         Parameters
         ----------
         resource_type : str
             The AWS resource type for the recover point. Accepted values are:
+                All (default)
                 Aurora
                 DocumentDB
                 CloudFormation
@@ -54,32 +257,48 @@ class Vault():
         created_before : str, datetime
             This is used to search for recovery points created before a date
             Options for usage are string format eg. '2024-01-01' or datetime(2024, 1, 1)
+            Defaults to the current time
             
         created_after : str, datetime
             This is used to search for recovery points created after a date
             Options for usage are string format eg. '2024-01-01' or datetime(2024, 1, 1)
-        """
-        if resource_type == 'All':
-            response = self.client.list_recovery_points_by_backup_vault(
-                BackupVaultName=self.vault_name,
-                ByCreatedBefore=created_before,
-                ByCreatedAfter=created_after
-            )
-        else:
-            response = self.client.list_recovery_points_by_backup_vault(
-                BackupVaultName=self.vault_name,
-                ByResourceType=resource_type,
-                ByCreatedBefore=created_before,
-                ByCreatedAfter=created_after
-            )
+            Defaults to 2015-01-01
             
-        return response
+        max_items : int
+            The maximum number of Recovery Points to return. Returns all by default
+        """
+        items = self.list_backups_raw(resource_type=resource_type,
+                                      created_before=created_before,
+                                      created_after=created_after,
+                                      max_items=max_items)
+        
+        return (RecoveryPoint.from_response(item) for item in items)
+    
+    def list_backups_raw(self, 
+                         resource_type='All', 
+                         created_before=None, 
+                         created_after=None,
+                         max_items=None):
+        """
+        Lists the Recovery Points in the Vault as the raw dicts returned by boto3
+        
+        Takes the same parameters as list_backups
+        """
+        kwargs = _list_backups_kwargs(self.vault_name, resource_type, created_before, 
+                                      created_after, max_items)
+        
+        return self._iter_recovery_points(kwargs)
+    
+    def _iter_recovery_points(self, kwargs):
+        paginator = self.client.get_paginator('list_recovery_points_by_backup_vault')
+        for page in paginator.paginate(**kwargs):
+            yield from page.get('RecoveryPoints', [])
     
     def copy_backups(self, 
                      destination_vault,
                      recovery_point,
                      region='us-east-1',
-                     dest_account=boto3.client('sts').get_caller_identity().get('Account'),
+                     dest_account=None,
                      retention_period=35):
         """
         Copies a Recovery Point in the Vault to a different Vault in the same or different region
@@ -97,16 +316,28 @@ class Vault():
             
         dest_account : str
             The AWS account the destination Vault is located
+            Defaults to the account of the current credentials
             
         retention_period : int
             The length of time (in days) the Recovery Point will remain in the Vault before deletion
         """
+        return self._copy_backup(self.client, destination_vault, recovery_point, region, 
+                                 dest_account, retention_period)
+    
+    def _copy_backup(self, client, destination_vault, recovery_point, region, dest_account, 
+                     retention_period):
+        dest_account = dest_account or _cached_account(self.region)
         
-        response = self.client.start_copy_job(
+        response = client.start_copy_job(
             RecoveryPointArn=recovery_point,
             SourceBackupVaultName=self.vault_name,
-            DestinationBackupVaultArn=f'arn:aws:backup:{region}:{dest_account}:backup-vault:{destination_vault}',
-            IamRoleArn=f'arn:aws:iam::{self.account}:role/service-role/AWSBackupDefaultServiceRole',
+            DestinationBackupVaultArn=_DEST_VAULT_ARN.format_map({
+                'partition': self._partition,
+                'region': region,
+                'account': dest_account,
+                'name': destination_vault
+            }),
+            IamRoleArn=self._role_arn,
             Lifecycle={
                 'DeleteAfterDays': retention_period
             }
@@ -114,13 +345,62 @@ class Vault():
         
         return response
         
+    def copy_backups_bulk(self, 
+                          destination_vault,
+                          recovery_points,
+                          region='us-east-1',
+                          dest_account=None,
+                          retention_period=35,
+                          workers=32):
+        """
+        Copies many Recovery Points in the Vault to a different Vault in parallel
+        
+        Parameters
+        ----------
+        destination_vault : str
+            The Vault the Recovery Points are to be copied to
+            
+        recovery_points : list
+            The Recovery Point ARNs that are to be copied
+            
+        region : str
+            The AWS region that the destination Vault is located
+            
+        dest_account : str
+            The AWS account the destination Vault is located
+            
+        retention_period : int
+            The length of time (in days) the Recovery Points will remain in the Vault before deletion
+            
+        workers : int
+            The number of copy jobs started concurrently. Above 50 workers a client 
+            with a connection pool of this size is used so threads do not wait on sockets
+        
+        Returns one entry per Recovery Point, in the same order as recovery_points, holding 
+        either the copy job response or the exception raised for that Recovery Point. 
+        Exceptions are not raised so the jobs that did start are never lost
+        """
+        return self._bulk(
+            lambda client, recovery_point: self._copy_backup(
+                client,
+                destination_vault,
+                recovery_point,
+                region,
+                dest_account,
+                retention_period
+            ),
+            recovery_points,
+            workers
+        )
+        
     def restore_ebs(self, 
                     recovery_point, 
                     az='us-east-1a',
                     iops='3000',
                     kms_key=None,
                     throughput='125',
-                    vol_type='gp3'):
+                    vol_type='gp3',
+                    wait=False):
         
         """
         Restores an EBS volume from a Recovery Point
@@ -144,49 +424,30 @@ class Vault():
             
         vol_type : str
             The volume type for the EBS volume         
-        """
         
-        rec_point_desc = self._describe_backup(recovery_point)
-        if rec_point_desc['IsEncrypted'] == True:
-            encrypted = 'true'
-        else:
-            encrypted = 'false'
-        
-        if encrypted == 'true' and kms_key == None:
-            kms_key = rec_point_desc['EncryptionKeyArn']
-                   
-        if encrypted == 'true' or kms_key:
-            metadata = {
-                "availabilityzone": az,
-                "encrypted": encrypted,
-                "iops": iops,
-                "kmskeyid": kms_key,
-                "throughput": throughput,
-                "volumesize": str(self._get_vol_size(recovery_point)),
-                "volumetype": vol_type
-            }
-        else:
-            metadata = {
-                "availabilityzone": az,
-                "encrypted": encrypted,
-                "iops": iops,
-                "throughput": throughput,
-                "volumesize": str(self._get_vol_size(recovery_point)),
-                "volumetype": vol_type
-            }
+        wait : bool
+            Waits for the restore job to finish and returns its final description.
+            By default the start_restore_job response is returned immediately.
+            Raises TimeoutError if the job has not finished after about an hour
+        """
+        return self._restore_ebs(self.client, recovery_point, az, iops, kms_key, throughput, 
+                                 vol_type, wait)
+    
+    def _restore_ebs(self, client, recovery_point, az, iops, kms_key, throughput, vol_type, wait):
+        rec_point_desc = self._describe_backup(recovery_point, client)
+        metadata = _ebs_restore_metadata(rec_point_desc, az, iops, kms_key, throughput, vol_type)
         
-        response = self.client.start_restore_job(
+        response = client.start_restore_job(
             RecoveryPointArn=recovery_point,
             Metadata=metadata,
-            IamRoleArn=f'arn:aws:iam::{self.account}:role/service-role/AWSBackupDefaultServiceRole',
+            IamRoleArn=self._role_arn,
             CopySourceTagsToRestoredResource=True
         )
         
-        restore = self.client.describe_restore_job(
-            RestoreJobId=response['RestoreJobId']
-        )
+        if not wait:
+            return response
         
-        return restore
+        return self._wait_for_restore(response['RestoreJobId'], client)
     
     def restore_ec2(self, 
                     recovery_point, 
@@ -226,24 +487,115 @@ class Vault():
         response = self.client.start_restore_job(
             RecoveryPointArn=recovery_point,
             Metadata=metadata,
-            IamRoleArn=f'arn:aws:iam::{self.account}:role/service-role/AWSBackupDefaultServiceRole',
+            IamRoleArn=self._role_arn,
             CopySourceTagsToRestoredResource=True
         )
         
         return response
                 
-    def _get_vol_size(self, recovery_point):
-        vol_size = self.client.describe_recovery_point(
-            BackupVaultName=self.vault_name,
-            RecoveryPointArn=recovery_point
+    def restore_ebs_bulk(self, 
+                         recovery_points, 
+                         az='us-east-1a',
+                         iops='3000',
+                         kms_key=None,
+                         throughput='125',
+                         vol_type='gp3',
+                         wait=False,
+                         workers=32):
+        """
+        Restores many EBS volumes from Recovery Points in parallel
+        
+        Parameters
+        ----------          
+        recovery_points : list
+            The Recovery Point ARNs that are to be restored
+            
+        az, iops, kms_key, throughput, vol_type, wait
+            Used for every Recovery Point, see restore_ebs
+            
+        workers : int
+            The number of restore jobs started concurrently. Above 50 workers a client 
+            with a connection pool of this size is used so threads do not wait on sockets
+        
+        Returns one entry per Recovery Point, in the same order as recovery_points, holding 
+        either the restore job response or the exception raised for that Recovery Point. 
+        Exceptions are not raised so the jobs that did start are never lost
+        """
+        return self._bulk(
+            lambda client, recovery_point: self._restore_ebs(
+                client,
+                recovery_point,
+                az,
+                iops,
+                kms_key,
+                throughput,
+                vol_type,
+                wait
+            ),
+            recovery_points,
+            workers
         )
+                
+    def _bulk(self, func, items, workers):
+        # Each worker needs its own pooled connection or the threads queue for
+        # sockets, so use a client whose pool is at least as large as the executor
+        client = _bulk_client(self.region, workers)
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(func, client, item) for item in items]
         
-        return int(vol_size['BackupSizeInBytes']/1024/1024/1024)
+        # A failed item must not hide the jobs that did start, so its exception
+        # is returned in its place rather than raised
+        results = []
+        for future in futures:
+            error = future.exception()
+            results.append(error if error is not None else future.result())
+        
+        return results
+                
+    def _wait_for_restore(self, restore_job_id, client=None):
+        client = client or self.client
+        delay = 2
+        for _ in range(_RESTORE_WAIT_MAX_ATTEMPTS):
+            restore = client.describe_restore_job(
+                RestoreJobId=restore_job_id
+            )
+            if restore['Status'] in _RESTORE_TERMINAL_STATUSES:
+                return restore
+            
+            time.sleep(delay)
+            delay = min(delay * 2, 8)
+        
+        raise TimeoutError(
+            f"Restore job {restore_job_id} did not finish after {_RESTORE_WAIT_MAX_ATTEMPTS} checks, "
+            f"last status was {restore['Status']}"
+        )
+                
+    def _get_vol_size(self, recovery_point):
+        vol_size = self._describe_backup(recovery_point)
+        
+        return int(vol_size['BackupSizeInBytes']) >> 30
     
-    def _describe_backup(self, recovery_point):
-        response = self.client.describe_recovery_point(
+    def _describe_backup(self, recovery_point, client=None):
+        # Only the fields that never change (size, encryption, key) are kept, in a
+        # least recently used cache per ARN, so no caller can read a stale status
+        with self._rp_cache_lock:
+            description = self._rp_cache.get(recovery_point)
+            if description is not None:
+                self._rp_cache.move_to_end(recovery_point)
+                return description
+        
+        client = client or self.client
+        response = client.describe_recovery_point(
             BackupVaultName=self.vault_name,
             RecoveryPointArn=recovery_point
         )
+        description = _rp_description(response)
+        
+        with self._rp_cache_lock:
+            self._rp_cache[recovery_point] = description
+            self._rp_cache.move_to_end(recovery_point)
+            if len(self._rp_cache) > _RP_CACHE_SIZE:
+                self._rp_cache.popitem(last=False)
         
-        return response
\ No newline at end of file
+        return description
\ No newline at end of file